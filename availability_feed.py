@@ -0,0 +1,242 @@
+import json
+import sys
+from bisect import bisect_left, insort
+
+from concert_hotel_recommender import ConcertHotelRecommender
+from hotel_schema import HOTEL_SCHEMA, compile_validator
+
+try:
+    # 순서 유지 자료구조 (삽입/삭제/순위 조회 O(log n))
+    from sortedcontainers import SortedList
+except ImportError:
+    SortedList = None
+    print("⚠️ sortedcontainers not installed - rank updates fall back to O(n) list inserts.")
+    print("   Please run: pip install sortedcontainers")
+
+# 델타로 갱신 가능한 필드 (티켓 오픈 중 계속 변하는 값들)
+DELTA_FIELDS = ("rooms_left", "is_available", "price_krw", "is_price_gouging")
+# calculate_fan_match_score가 읽는 델타 필드 (나머지는 바뀌어도 점수 불변)
+SCORED_FIELDS = ("is_price_gouging",)
+# 변경 이벤트 종류별 필드
+EVENT_FIELDS = {
+    "availability_changed": ("rooms_left", "is_available"),
+    "price_changed": ("price_krw", "is_price_gouging")
+}
+# 델타 값 검증/변환기 (호텔 스키마의 해당 필드 규칙 재사용, 델타에는 일부 필드만 오므로 모두 선택 필드)
+validate_delta = compile_validator({k: {**HOTEL_SCHEMA[k], "required": False} for k in DELTA_FIELDS})
+
+
+class _RankIndex:
+    """정렬 키 목록 - sortedcontainers가 없으면 bisect 기반 리스트로 대체 (갱신당 O(n), import 시 경고)"""
+
+    def __init__(self, keys):
+        if SortedList is not None:
+            self._keys = SortedList(keys)
+        else:
+            self._keys = sorted(keys)
+
+    def add(self, key):
+        if SortedList is not None:
+            self._keys.add(key)
+        else:
+            insort(self._keys, key)
+
+    def remove(self, key):
+        if SortedList is not None:
+            self._keys.remove(key)
+        else:
+            del self._keys[bisect_left(self._keys, key)]
+
+    def rank(self, key):
+        return self._keys.bisect_left(key) if SortedList is not None else bisect_left(self._keys, key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+class AvailabilityFeed:
+    """
+    실시간 재고/가격 델타를 점수화된 호텔 목록에 반영하는 증분 재정렬기.
+    전체 카탈로그를 다시 돌리지 않고, 바뀐 호텔만 재채점 후 순위 인덱스에서 이동시킨다.
+    """
+
+    def __init__(self, hotels, recommender=None, bookable_first=False):
+        self.recommender = recommender or ConcertHotelRecommender()
+        # 발행된 순위와 같은 규칙 사용: 기본은 점수순, 숙박 구간(stay) 모드 출력이면 예약 가능 호텔 우선
+        self.bookable_first = bookable_first
+        self.dirty = False
+        # 같은 id가 여러 번 나올 수 있음 (hotels + map/hotels 병합 결과) - 위치 단위로 관리
+        self.entries = [h for h in hotels if isinstance(h, dict) and h.get('id')]
+        self._positions = {}
+        self._keys = []
+        for pos, hotel in enumerate(self.entries):
+            self._positions.setdefault(hotel['id'], []).append(pos)
+            self._keys.append(self.rank_key(hotel, pos))
+        self.index = _RankIndex(self._keys)
+
+    @classmethod
+    def from_file(cls, path="concert_recommendations.json", recommender=None):
+        """추천 결과 파일에서 현재 순위 상태 로드"""
+        with open(path, "r", encoding='utf-8') as f:
+            data = json.load(f)
+
+        if recommender is None:
+            recommender = ConcertHotelRecommender()
+            try:
+                with open("reddit_fan_analysis.json", "r", encoding='utf-8') as f:
+                    recommender.analysis = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                print("⚠️ reddit_fan_analysis.json unavailable, using default weights")
+        stay_mode = 'stay' in (data.get('concert_info') or {})
+        return cls(data.get('top_recommendations', []), recommender, bookable_first=stay_mode)
+
+    def rank_key(self, hotel, pos):
+        # 정렬 기준은 generate_recommendations와 같음: (예약 가능 우선) → 점수 내림차순.
+        # 동점 처리만 다름: 배치 정렬은 입력(korean_ota_hotels.json) 순서로 동점을 가르지만
+        # 출력 파일에는 입력 순서가 남지 않으므로 여기서는 출력 파일 내 위치를 쓴다.
+        # 점수가 바뀌어 동점 그룹에 새로 들어간 호텔은 전체 재실행 결과와 그룹 내 자리가 다를 수 있다.
+        score_key = (-hotel.get('fan_match_score', 0), pos)
+        if self.bookable_first:
+            return (not ConcertHotelRecommender.is_bookable(hotel),) + score_key
+        return score_key
+
+    def apply(self, delta):
+        """
+        델타 1건 적용 후 이벤트 목록 반환.
+        rank_changed에는 이동한 호텔만 담긴다 (사이에 있던 호텔들은 한 칸씩 밀린 것으로 간주).
+        """
+        if not isinstance(delta, dict):
+            print(f"⚠️ Skipping non-dict delta: {type(delta)}")
+            return []
+
+        positions = self._positions.get(delta.get('id'))
+        if not positions:
+            print(f"⚠️ Unknown hotel id in delta: {delta.get('id')}")
+            return []
+
+        # 레코드/순위 인덱스를 건드리기 전에 값 검증 - 잘못된 델타는 통째로 건너뜀
+        empty = [k for k in DELTA_FIELDS if k in delta and delta[k] in (None, "")]
+        clean, errs = validate_delta(delta)
+        errs = [(k, 'missing') for k in empty] + errs
+        if errs:
+            print(f"⚠️ Skipping invalid delta for {delta.get('id')}: "
+                  f"{', '.join(f'{field}: {code}' for field, code in errs)}")
+            return []
+        delta = clean
+
+        events = []
+        for pos in positions:
+            events.extend(self._apply_entry(pos, delta))
+        return events
+
+    def _apply_entry(self, pos, delta):
+        """
+        레코드 1건에 델타 반영. 적용된 변경마다 availability_changed / price_changed 이벤트를,
+        실제로 순위가 움직였을 때만 rank_changed 이벤트를 추가로 낸다.
+        """
+        hotel = self.entries[pos]
+        changes = {k: delta[k] for k in DELTA_FIELDS if k in delta and hotel.get(k) != delta[k]}
+        if 'rooms_left' in changes and 'is_available' not in delta:
+            is_available = changes['rooms_left'] > 0
+            if hotel.get('is_available') != is_available:
+                changes['is_available'] = is_available
+        if not changes:
+            return []
+
+        old_key = self._keys[pos]
+        old_rank = self.index.rank(old_key)
+
+        hotel.update(changes)
+        self.dirty = True
+        # 점수 계산에 쓰이는 필드가 바뀐 경우에만 재채점
+        if any(k in changes for k in SCORED_FIELDS):
+            hotel['fan_match_score'] = self.recommender.calculate_fan_match_score(hotel)
+
+        new_key = self.rank_key(hotel, pos)
+        if new_key != old_key:
+            self.index.remove(old_key)
+            self.index.add(new_key)
+            self._keys[pos] = new_key
+        new_rank = self.index.rank(new_key)
+
+        base = {"id": hotel['id'], "name_en": hotel.get('name_en'), "rank": new_rank + 1}
+        events = []
+        for event_type, fields in EVENT_FIELDS.items():
+            changed = {k: v for k, v in changes.items() if k in fields}
+            if changed:
+                events.append({"type": event_type, **base, "changes": changed})
+        if new_rank != old_rank:
+            events.append({
+                "type": "rank_changed",
+                **base,
+                "old_rank": old_rank + 1,
+                "new_rank": new_rank + 1,
+                "fan_match_score": hotel['fan_match_score'],
+                "changes": changes,
+            })
+        return events
+
+    def consume(self, deltas):
+        """델타 이터러블을 순서대로 적용하며 변경/순위 이벤트를 흘려보냄"""
+        for delta in deltas:
+            yield from self.apply(delta)
+
+    @staticmethod
+    def read_jsonl(path):
+        """JSONL 델타 파일 스트리밍 읽기 (한 줄 = 델타 1건)"""
+        with open(path, "r", encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"⚠️ Invalid delta on line {line_no}: {e}")
+
+    @staticmethod
+    def drain_queue(q, sentinel=None):
+        """프로세스 내 큐에서 sentinel이 나올 때까지 델타를 꺼냄"""
+        while True:
+            delta = q.get()
+            if delta is sentinel:
+                return
+            yield delta
+
+    def ranked(self):
+        """현재 순위대로 정렬된 호텔 목록"""
+        return [self.entries[key[-1]] for key in self.index]
+
+    def save(self, path="concert_recommendations.json"):
+        try:
+            with open(path, "r", encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+        data['top_recommendations'] = self.ranked()
+        with open(path, "w", encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        print(f"💾 Saved to: {path}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python3 availability_feed.py <deltas.jsonl> [concert_recommendations.json]")
+        sys.exit(1)
+
+    target = sys.argv[2] if len(sys.argv) > 2 else "concert_recommendations.json"
+    feed = AvailabilityFeed.from_file(target)
+    print(f"📊 Loaded {len(feed.index)} ranked hotels")
+
+    counts = {}
+    for event in feed.consume(AvailabilityFeed.read_jsonl(sys.argv[1])):
+        counts[event['type']] = counts.get(event['type'], 0) + 1
+        print(json.dumps(event, ensure_ascii=False))
+
+    print(f"✅ {sum(counts.values())} events emitted {counts}")
+    # 반영된 변경이 없으면 파일을 건드리지 않음
+    if feed.dirty:
+        feed.save(target)
@@ -45,6 +45,8 @@ echo "📂 데이터 파일 생성 및 준비 중..."
 if command -v python3 &> /dev/null; then
     echo "🐍 리커멘더 엔진 실행 (최신 데이터 생성)..."
     python3 concert_hotel_recommender.py
+    echo "🖼️ 이미지 URL 상태 점검 (깨진 이미지 자동 대체)..."
+    python3 image_health.py concert_recommendations.json
 else
     echo "⚠️ python3를 찾을 수 없습니다. 기존 데이터를 사용합니다."
 fi
@@ -54,15 +56,38 @@ if [ ! -d "public" ]; then
     mkdir -p public
 fi
 
-if [ -f "concert_recommendations.json" ]; then
-    echo "   Running: cp concert_recommendations.json public/"
-    cp concert_recommendations.json public/
-    echo "✅ 데이터 파일 이동 완료"
-else
+if [ ! -f "concert_recommendations.json" ]; then
     echo "❌ Error: concert_recommendations.json 파일 생성 실패."
     exit 1
 fi
 
+# 지도 마커 클러스터 타일 생성 (줌별 사전 계산 → public/map_tiles/{z}/{x}/{y}.json)
+# 타일은 gitignore 대상이므로 변경 감지보다 먼저 만들어 새로 받은 체크아웃에서도 항상 존재하게 함
+if command -v python3 &> /dev/null; then
+    echo "🗺️ 지도 클러스터 타일 생성 중..."
+    python3 map_clusters.py concert_recommendations.json public/map_tiles
+fi
+
+# 변경 감지: 마지막으로 배포에 성공한 스냅샷과 비교해 데이터/프론트엔드 모두 그대로면 빌드/배포 생략
+# (스냅샷은 배포 성공 후에만 기록하므로 빌드/배포가 실패하면 다음 실행에서 다시 시도됨, FORCE_DEPLOY=1 로 강제 가능)
+SNAPSHOT_DIR=".last_deploy"
+if [ "$FORCE_DEPLOY" != "1" ] && [ -f "$SNAPSHOT_DIR/concert_recommendations.json" ] && [ -f "$SNAPSHOT_DIR/frontend.sha1" ] && command -v python3 &> /dev/null; then
+    echo "🔎 마지막 배포 이후 변경 여부 확인 중..."
+    if [ "$(python3 recommendations_diff.py --fingerprint)" != "$(cat "$SNAPSHOT_DIR/frontend.sha1")" ]; then
+        echo "   프론트엔드 소스 변경 감지 (src/, package-lock.json 등)"
+    else
+        python3 recommendations_diff.py "$SNAPSHOT_DIR/concert_recommendations.json" concert_recommendations.json
+        if [ $? -eq 0 ]; then
+            echo "✅ 추천 데이터/프론트엔드 변경 없음 - 빌드 및 배포를 건너뜁니다."
+            exit 0
+        fi
+    fi
+fi
+
+echo "   Running: cp concert_recommendations.json public/"
+cp concert_recommendations.json public/
+echo "✅ 데이터 파일 이동 완료"
+
 # 3. 빌드 실행
 echo "🏗️ 프로젝트 빌드 시작 (npm run build)..."
 npm install
@@ -75,6 +100,11 @@ else
     exit 1
 fi
 
+# 빌드 후 지문 계산 (npm install이 package-lock.json을 고쳐 쓰는 경우까지 반영)
+if command -v python3 &> /dev/null; then
+    DEPLOYED_FRONTEND=$(python3 recommendations_diff.py --fingerprint)
+fi
+
 # 4. 배포 실행
 echo "🚀 Vercel 배포 시작 (vercel --prod)..."
 if command -v vercel &> /dev/null; then
@@ -85,6 +115,19 @@ else
     npx vercel --prod
 fi
 
+if [ $? -ne 0 ]; then
+    echo "❌ 배포 실패. 로그를 확인해주세요."
+    exit 1
+fi
+
+# 배포 성공 시에만 비교 기준 스냅샷 갱신
+mkdir -p "$SNAPSHOT_DIR"
+cp concert_recommendations.json "$SNAPSHOT_DIR/concert_recommendations.json"
+if [ -n "$DEPLOYED_FRONTEND" ]; then
+    echo "$DEPLOYED_FRONTEND" > "$SNAPSHOT_DIR/frontend.sha1"
+fi
+echo "💾 배포 스냅샷 저장: $SNAPSHOT_DIR/"
+
 echo "========================================================"
 echo "🎉 모든 작업이 완료되었습니다!"
 echo "========================================================"
@@ -2,13 +2,22 @@ import json
 import os
 import math
 
+from hotel_schema import validate_hotels, print_report
+from output_dictionary import intern_hotels
+
 class ConcertHotelRecommender:
     def __init__(self):
         self.hotels = []
         self.analysis = {}
+        self.schema_report = {}
         # Goyang Stadium Coordinates
         self.venue_coords = (37.6556, 126.7714)
 
+    @staticmethod
+    def is_bookable(hotel):
+        """예약 가능 여부 (rooms_left 정보가 없으면 is_available만 따름)"""
+        return bool(hotel.get('is_available', True)) and (hotel.get('rooms_left') is None or hotel.get('rooms_left', 0) > 0)
+
     def calculate_distance(self, lat1, lon1, lat2, lon2):
         """
         Calculate the great circle distance between two points 
@@ -90,6 +99,14 @@ class ConcertHotelRecommender:
         except json.JSONDecodeError as e:
             print(f"❌ Error: Invalid JSON format - {e}")
             self.hotels = []
+
+        # 스키마 일괄 검증 - 좌표/가격 오류나 잘못된 중첩 구조는 순위 계산 전에 제외
+        self.hotels, self.schema_report = validate_hotels(self.hotels)
+        print_report(self.schema_report)
+
+        # 반복되는 하위 객체(hotel_type, cancellation 등)를 공유 인스턴스로 인터닝해 메모리 절감
+        shared = intern_hotels(self.hotels)
+        print(f"✓ Interned {shared} repeated sub-objects")
             
         # 레딧 분석 결과 로드
         try:
@@ -122,27 +139,13 @@ class ConcertHotelRecommender:
                 "budget_sensitivity": 0.95
             }
         
-        # 0. 거리 계산 (필수)
-        lat = hotel.get('lat')
-        lng = hotel.get('lng')
-        
+        # 0. 거리 계산 (필수) - load_data에서 스키마 검증/변환을 거쳐 좌표는 float 보장
         # distance_km이 이미 있으면 사용, 없으면 좌표로 계산
         dist = hotel.get('distance_km')
         
         if dist is None or dist == "":
-            if lat and lng:
-                try:
-                    dist = self.calculate_distance(self.venue_coords[0], self.venue_coords[1], float(lat), float(lng))
-                    hotel['distance_km'] = round(dist, 1) # 저장해둠
-                except (ValueError, TypeError):
-                    dist = 20.0 # 좌표 오류시 기본값 (멀리 설정)
-            else:
-                dist = 20.0 # 좌표 없으면 멀리 설정
-        else:
-            try:
-                dist = float(dist)
-            except (ValueError, TypeError):
-                dist = 20.0
+            dist = self.calculate_distance(self.venue_coords[0], self.venue_coords[1], hotel['lat'], hotel['lng'])
+            hotel['distance_km'] = round(dist, 1) # 저장해둠
 
         # 1. 위치 가중치 (88%)
         # 고양시 경기장 근처 우대
@@ -173,8 +176,8 @@ class ConcertHotelRecommender:
         # 3. 최종 점수 산출 (100점 초과 허용 - 강력 추천 호텔 구분을 위해)
         return round(base_score, 1)
 
-    def generate_recommendations(self):
-        """추천 데이터 생성"""
+    def generate_recommendations(self, stay=None):
+        """추천 데이터 생성 (stay=(체크인, 체크아웃) 지정 시 박별 달력 기준으로 가격/재고 반영)"""
         print("\n" + "="*60)
         print("🎵 ARMY Stay Hub - Concert Hotel Recommender")
         print("   BTS ARIRANG World Tour 2026")
@@ -257,12 +260,24 @@ class ConcertHotelRecommender:
         
         print(f"\n✅ Scored {len(valid_hotels)} valid hotels\n")
         
+        # 숙박 구간 지정 시: 박별 가격/재고 달력으로 총액과 구간 내 최소 잔여 객실 반영
+        if stay:
+            from price_calendar import PriceCalendar
+            check_in, check_out = stay
+            calendar = PriceCalendar.from_hotels(valid_hotels, check_in, check_out)
+            calendar.annotate(valid_hotels, check_in, check_out)
+            print(f"📅 Stay {check_in} → {check_out}: {int(calendar.available_mask(check_in, check_out).sum())} hotels available all nights")
+
         # 가중치 순으로 정렬
         sorted_hotels = sorted(valid_hotels, key=lambda x: x.get('fan_match_score', 0), reverse=True)
 
         # 쿼터제 및 수량 제한 완전 해제 (사용자 요청: 모든 숙소 복구 - Seoul 49, Goyang 27, Busan 10)
         # 단순히 점수순으로 정렬하여 전체 반환
-        final_list = sorted(valid_hotels, key=lambda x: x.get('fan_match_score', 0), reverse=True)
+        # 숙박 구간 지정 시에는 구간 내내 예약 가능한 호텔 우선, 그 안에서 점수순
+        if stay:
+            final_list = sorted(valid_hotels, key=lambda x: (not self.is_bookable(x), -x.get('fan_match_score', 0)))
+        else:
+            final_list = sorted(valid_hotels, key=lambda x: x.get('fan_match_score', 0), reverse=True)
         
         # Debugging counts
         s_cnt = 0
@@ -307,7 +322,8 @@ class ConcertHotelRecommender:
                 "tour": "BTS ARIRANG World Tour 2026",
                 "locations": ["Seoul", "Goyang", "Busan"],
                 "generated_at": "2026-02-07",
-                "total_hotels_analyzed": len(valid_hotels)
+                "total_hotels_analyzed": len(valid_hotels),
+                **({"stay": {"check_in": str(stay[0]), "check_out": str(stay[1])}} if stay else {})
             },
             "top_recommendations": final_list
         }
@@ -327,5 +343,7 @@ class ConcertHotelRecommender:
         print("="*60 + "\n")
 
 if __name__ == "__main__":
+    import sys
+    # 사용법: python3 concert_hotel_recommender.py [체크인 체크아웃]  (예: 2026-06-12 2026-06-14)
     recommender = ConcertHotelRecommender()
-    recommender.generate_recommendations()
+    recommender.generate_recommendations(stay=tuple(sys.argv[1:3]) if len(sys.argv) > 2 else None)
@@ -0,0 +1,172 @@
+import json
+import sys
+import math
+from collections import Counter
+
+# 호텔 레코드 스키마
+# type: 기대 타입 (튜플이면 허용 타입 중 하나 - 원본 데이터에 str/dict 혼재)
+# required: 없으면 레코드 거부 / min, max: 숫자 범위
+# fields: dict일 때 하위 필드 타입 / items: list일 때 원소 타입
+HOTEL_SCHEMA = {
+    "id": {"type": "str", "required": True},
+    "name_en": {"type": "str", "required": True},
+    "lat": {"type": "float", "required": True, "min": -90, "max": 90},
+    "lng": {"type": "float", "required": True, "min": -180, "max": 180},
+    "price_krw": {"type": "int", "required": True, "min": 0},
+    "rooms_left": {"type": "int", "min": 0},
+    "is_available": {"type": "bool"},
+    "is_price_gouging": {"type": "bool"},
+    "distance_km": {"type": "float", "min": 0},
+    "rating": {"type": "float", "min": 0, "max": 5},
+    "image_url": {"type": "str"},
+    "city_key": {"type": "str"},
+    "location": {"type": ("dict", "str"), "fields": {"address_en": "str", "area_en": "str"}},
+    "tags": {"type": ("dict", "str"), "fields": {"display_en": "str", "list_en": "list"}},
+    "platform": {"type": ("dict", "str"), "fields": {"name": "str"}},
+    "transport": {"type": ("dict", "str")},
+    "map_detail": {"type": "dict", "fields": {"hotel": "dict", "venue": "dict", "nearby_spots": "list"}},
+    "nearby": {"type": "list", "items": "dict"}
+}
+
+_PY_TYPES = {"str": "str", "dict": "dict", "list": "list"}
+_TRUE = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False}
+
+
+def _emit_field(lines, name, spec):
+    """필드 하나에 대한 검증/변환 코드 생성"""
+    kind = spec["type"]
+    lines.append(f"    v = r.get({name!r}, _MISSING)")
+    lines.append("    if v is _MISSING or v is None or v == '':")
+    if spec.get("required"):
+        lines.append(f"        errs.append(({name!r}, 'missing'))")
+    else:
+        # 선택 필드는 원본 그대로 둠 (빈 값은 없는 것으로 취급)
+        lines.append("        pass")
+    lines.append("    else:")
+
+    if kind == "float" or kind == "int":
+        cast = "float(v)" if kind == "float" else "int(float(v.replace(',', '')) if isinstance(v, str) else v)"
+        lines.append("        try:")
+        lines.append("            if isinstance(v, bool): raise TypeError")
+        lines.append(f"            v = {cast}")
+        # NaN/Infinity (json.load가 허용) 및 '1e999' 같은 범위 초과 값은 오류 처리
+        lines.append("            if not _isfinite(v): raise ValueError")
+        lines.append("        except (TypeError, ValueError, OverflowError):")
+        lines.append(f"            errs.append(({name!r}, 'bad_{kind}'))")
+        lines.append("        else:")
+        checks = []
+        if "min" in spec:
+            checks.append(f"v < {spec['min']!r}")
+        if "max" in spec:
+            checks.append(f"v > {spec['max']!r}")
+        if checks:
+            lines.append(f"            if {' or '.join(checks)}:")
+            lines.append(f"                errs.append(({name!r}, 'out_of_range'))")
+            lines.append("            else:")
+            lines.append(f"                out[{name!r}] = v")
+        else:
+            lines.append(f"            out[{name!r}] = v")
+    elif kind == "bool":
+        lines.append("        if isinstance(v, bool):")
+        lines.append("            pass")
+        lines.append("        elif str(v).lower() in _TRUE:")
+        lines.append(f"            out[{name!r}] = _TRUE[str(v).lower()]")
+        lines.append("        else:")
+        lines.append(f"            errs.append(({name!r}, 'bad_bool'))")
+    else:
+        kinds = kind if isinstance(kind, tuple) else (kind,)
+        py_types = ", ".join(_PY_TYPES[k] for k in kinds)
+        lines.append(f"        if not isinstance(v, ({py_types},)):")
+        lines.append(f"            errs.append(({name!r}, 'wrong_type'))")
+        if "fields" in spec:
+            lines.append("        elif isinstance(v, dict):")
+            for sub, sub_kind in spec["fields"].items():
+                lines.append(f"            s = v.get({sub!r})")
+                lines.append(f"            if s is not None and not isinstance(s, {_PY_TYPES[sub_kind]}):")
+                lines.append(f"                errs.append(({name + '.' + sub!r}, 'wrong_nesting'))")
+        if "items" in spec:
+            lines.append("        elif isinstance(v, list):")
+            lines.append(f"            if any(not isinstance(i, {_PY_TYPES[spec['items']]}) for i in v):")
+            lines.append(f"                errs.append(({name + '[]'!r}, 'wrong_nesting'))")
+
+
+def compile_validator(schema=HOTEL_SCHEMA):
+    """
+    스키마로부터 레코드 검증 함수를 한 번 생성해 컴파일.
+    필드별 분기가 평범한 파이썬 코드로 펼쳐지므로 레코드당 스키마 해석 비용이 없다.
+    반환 함수: record -> (변환된 레코드 또는 None, [(필드, 오류코드), ...])
+    """
+    lines = [
+        "def validate(r):",
+        "    if not isinstance(r, dict):",
+        "        return None, [('<record>', 'not_an_object')]",
+        "    errs = []",
+        "    out = {}"
+    ]
+    for name, spec in schema.items():
+        _emit_field(lines, name, spec)
+    lines += [
+        "    if errs:",
+        "        return None, errs",
+        "    if out:",
+        "        r = {**r, **out}",
+        "    return r, errs"
+    ]
+    namespace = {"_MISSING": object(), "_TRUE": _TRUE, "_isfinite": math.isfinite}
+    exec(compile("\n".join(lines), "<hotel_schema>", "exec"), namespace)
+    return namespace["validate"]
+
+
+validate_hotel = compile_validator()
+
+
+def validate_hotels(records, validator=validate_hotel):
+    """
+    레코드 일괄 검증. (통과한 레코드 목록, 배치 오류 리포트) 반환.
+    리포트에는 오류 코드별 집계와 거부된 레코드별 상세가 담긴다.
+    """
+    valid = []
+    rejected = []
+    by_error = Counter()
+    for idx, record in enumerate(records):
+        clean, errs = validator(record)
+        if clean is not None:
+            valid.append(clean)
+            continue
+        rid = record.get("id") if isinstance(record, dict) else None
+        rejected.append({"index": idx, "id": rid, "errors": [f"{field}: {code}" for field, code in errs]})
+        by_error.update(f"{field}: {code}" for field, code in errs)
+
+    report = {
+        "total": len(valid) + len(rejected),
+        "valid": len(valid),
+        "rejected": len(rejected),
+        "by_error": dict(by_error.most_common()),
+        "records": rejected
+    }
+    return valid, report
+
+
+def print_report(report, limit=10):
+    print(f"🧪 Schema check: {report['valid']}/{report['total']} hotels valid, {report['rejected']} rejected")
+    for error, count in list(report["by_error"].items())[:limit]:
+        print(f"   ⚠️ {error} x{count}")
+
+
+if __name__ == "__main__":
+    # 사용법: python3 hotel_schema.py [korean_ota_hotels.json]
+    path = sys.argv[1] if len(sys.argv) > 1 else "korean_ota_hotels.json"
+    with open(path, "r", encoding='utf-8') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        hotels = list(data.get("hotels", []))
+        if isinstance(data.get("map"), dict):
+            hotels += data["map"].get("hotels", [])
+    else:
+        hotels = data
+
+    _, batch_report = validate_hotels(hotels)
+    print_report(batch_report)
+    for item in batch_report["records"][:10]:
+        print(f"   ❌ #{item['index']} {item['id']}: {', '.join(item['errors'])}")
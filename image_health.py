@@ -0,0 +1,200 @@
+import os
+import sys
+import json
+import time
+import threading
+import http.client
+from urllib.parse import urlsplit, urljoin
+from concurrent.futures import ThreadPoolExecutor
+
+# 깨진 이미지 대체용 기본 URL (핫링크 차단이 없는 Unsplash)
+DEFAULT_FALLBACK_IMAGE = "https://images.unsplash.com/photo-1566073771259-6a8506099945?w=800"
+# HEAD를 거부하는 서버가 돌려주는 상태 코드 → 1바이트 Range GET으로 재시도
+HEAD_REJECTED = {403, 405, 501}
+MAX_REDIRECTS = 3
+
+
+def classify(status, content_type):
+    """
+    응답 판정: True = 정상 이미지, False = 확실히 깨짐, None = 일시 장애 (판단 보류).
+    깨짐으로 보는 것은 4xx(429 제외)와 이미지가 아닌 2xx 응답뿐이고,
+    5xx/429/리다이렉트 초과 등은 네트워크 상태 탓일 수 있으므로 기존 URL을 유지한다.
+    """
+    if 200 <= status < 300:
+        return not content_type or content_type.startswith("image/")
+    if 400 <= status < 500 and status != 429:
+        return False
+    return None
+
+
+class ImageHealthChecker:
+    """
+    image_url 상태 점검기.
+    스레드 수만큼으로 제한된 호스트별 keep-alive 연결을 재사용해 HEAD(또는 Range GET)를 병렬 전송하고,
+    결과는 TTL + ETag 캐시에 저장해 다음 빌드에서는 만료된 URL만 조건부 요청으로 재확인한다.
+    연결 실패/타임아웃/5xx 같은 일시 장애는 짧은 TTL로만 기록하고 대체하지 않는다.
+    """
+
+    def __init__(self, cache_path="image_health_cache.json", ttl_seconds=24 * 3600, transient_ttl_seconds=600,
+                 max_workers=16, timeout=5.0, fallback_url=DEFAULT_FALLBACK_IMAGE, fallbacks=None):
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_seconds
+        self.transient_ttl_seconds = transient_ttl_seconds
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.fallback_url = fallback_url
+        # 호텔 id별 대체 이미지 (없으면 fallback_url)
+        self.fallbacks = fallbacks or {}
+        self.cache = self._load_cache()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, "r", encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_cache(self):
+        with open(self.cache_path, "w", encoding='utf-8') as f:
+            json.dump(self.cache, f, indent=2, ensure_ascii=False)
+
+    def _connection(self, scheme, netloc):
+        """현재 스레드의 호스트별 연결 (스레드 풀 크기가 곧 연결 풀 상한)"""
+        pool = getattr(self._local, "pool", None)
+        if pool is None:
+            pool = self._local.pool = {}
+        key = (scheme, netloc)
+        if key not in pool:
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            pool[key] = cls(netloc, timeout=self.timeout)
+        return pool[key]
+
+    def _request(self, method, url, headers):
+        """요청 1회 (연결이 끊겨 있으면 한 번 재연결), 리다이렉트는 따라간다"""
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+
+            for attempt in (0, 1):
+                conn = self._connection(parts.scheme, parts.netloc)
+                try:
+                    conn.request(method, path, headers=headers)
+                    response = conn.getresponse()
+                    response.read()
+                    break
+                except (http.client.HTTPException, ConnectionError):
+                    conn.close()
+                    self._local.pool.pop((parts.scheme, parts.netloc), None)
+                    if attempt:
+                        raise
+
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+                url = urljoin(url, response.getheader("Location"))
+                continue
+            return response
+        return response
+
+    def check_url(self, url):
+        """URL 하나 점검 후 캐시 항목 반환 {"ok" (True/False/None), "status", "etag", "checked_at"}"""
+        now = time.time()
+        with self._lock:
+            cached = self.cache.get(url)
+        if cached:
+            ttl = self.ttl_seconds if cached.get("ok") is not None else self.transient_ttl_seconds
+            if now - cached.get("checked_at", 0) < ttl:
+                return cached
+
+        headers = {"User-Agent": "ARMY-Stay-ImageCheck/1.0"}
+        if cached and cached.get("etag") and cached.get("ok"):
+            headers["If-None-Match"] = cached["etag"]
+
+        try:
+            response = self._request("HEAD", url, headers)
+            if response.status in HEAD_REJECTED:
+                response = self._request("GET", url, {**headers, "Range": "bytes=0-0"})
+
+            if response.status == 304:
+                entry = {**cached, "status": 304, "checked_at": now}
+            else:
+                ok = classify(response.status, response.getheader("Content-Type") or "")
+                entry = {"ok": ok, "status": response.status, "etag": response.getheader("ETag"), "checked_at": now}
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            # 연결 거부/DNS 실패/타임아웃 - 이미지가 깨졌다는 근거가 아님
+            entry = {"ok": None, "status": None, "error": str(e), "etag": None, "checked_at": now}
+
+        with self._lock:
+            self.cache[url] = entry
+        return entry
+
+    def check_all(self, urls):
+        """URL 목록 병렬 점검 → {url: True/False/None}"""
+        unique = [u for u in dict.fromkeys(urls) if u]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = dict(zip(unique, executor.map(self.check_url, unique)))
+        return {url: entry["ok"] for url, entry in results.items()}
+
+    @staticmethod
+    def iter_image_holders(recommendations):
+        """image_url을 가진 모든 레코드 (최상위 호텔 + nearby 호텔)"""
+        for hotel in recommendations:
+            if not isinstance(hotel, dict):
+                continue
+            yield hotel
+            for near in hotel.get("nearby") or []:
+                if isinstance(near, dict):
+                    yield near
+
+    def fix_recommendations(self, data):
+        """확실히 깨진 image_url만 설정된 대체 이미지로 교체하고 교체 목록 반환 (판단 보류 URL은 유지)"""
+        holders = [h for h in self.iter_image_holders(data.get("top_recommendations", [])) if h.get("image_url")]
+        status = self.check_all([h["image_url"] for h in holders])
+
+        replaced = []
+        for holder in holders:
+            if status.get(holder["image_url"]) is not False:
+                continue
+            new_url = self.fallbacks.get(holder.get("id"), self.fallback_url)
+            replaced.append({"id": holder.get("id"), "old": holder["image_url"], "new": new_url})
+            holder["image_url"] = new_url
+        return replaced
+
+
+if __name__ == "__main__":
+    # 사용법: python3 image_health.py [concert_recommendations.json]
+    # image_fallbacks.json ({"default": url, "hotels": {id: url}}) 이 있으면 대체 이미지 설정으로 사용
+    target = sys.argv[1] if len(sys.argv) > 1 else "concert_recommendations.json"
+
+    config = {}
+    if os.path.exists("image_fallbacks.json"):
+        with open("image_fallbacks.json", "r", encoding='utf-8') as f:
+            config = json.load(f)
+
+    checker = ImageHealthChecker(fallback_url=config.get("default", DEFAULT_FALLBACK_IMAGE),
+                                 fallbacks=config.get("hotels", {}))
+
+    with open(target, "r", encoding='utf-8') as f:
+        data = json.load(f)
+
+    print("🖼️ Checking image URLs...")
+    fixed = checker.fix_recommendations(data)
+    checker.save_cache()
+
+    for item in fixed:
+        print(f"  ⚠️ {item['id']}: {item['old']} → {item['new']}")
+
+    # 일시 장애로 판단 보류된 URL은 교체하지 않고 다음 빌드에서 재확인
+    urls = {h["image_url"] for h in checker.iter_image_holders(data.get("top_recommendations", [])) if h.get("image_url")}
+    unknown = sum(1 for u in urls if checker.cache.get(u, {}).get("ok") is None)
+    if unknown:
+        print(f"  ⏳ {unknown} image URLs unreachable right now (kept as-is, retry after {checker.transient_ttl_seconds}s)")
+
+    if fixed:
+        with open(target, "w", encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        print(f"💾 Replaced {len(fixed)} broken images in {target}")
+    else:
+        print("✅ All image URLs healthy")
@@ -0,0 +1,183 @@
+import os
+import sys
+import json
+import math
+import shutil
+
+# 줌 범위 (5 = 한반도 전체, 16 = 골목 단위)
+MIN_ZOOM = 5
+MAX_ZOOM = 16
+# 타일 하나를 2^CELL_BITS × 2^CELL_BITS 격자로 나눠 클러스터링 (3 → 8×8, 256px 타일 기준 32px 셀)
+CELL_BITS = 3
+
+
+def world_xy(lat, lng):
+    """위경도 → 웹 메르카토르 정규 좌표 (0~1)"""
+    lat = max(min(lat, 85.05112878), -85.05112878)
+    x = (lng + 180.0) / 360.0
+    s = math.sin(math.radians(lat))
+    y = 0.5 - math.log((1 + s) / (1 - s)) / (4 * math.pi)
+    return x, y
+
+
+def _point_cluster(point):
+    """단일 지점을 셀 집계값으로 변환"""
+    is_hotel = point["kind"] == "hotel"
+    return {
+        "count": 1,
+        "hotel_count": 1 if is_hotel else 0,
+        "spot_count": 0 if is_hotel else 1,
+        "sum_lat": point["lat"],
+        "sum_lng": point["lng"],
+        "min_price_krw": point.get("price_krw") if is_hotel else None,
+        "top_score": point.get("fan_match_score") if is_hotel else None,
+        "top_id": point.get("id") if is_hotel else None,
+        "point": point
+    }
+
+
+def _merge(a, b):
+    """두 셀 집계값 병합 (부모 셀 계산용, 입력은 변경하지 않음)"""
+    prices = [p for p in (a["min_price_krw"], b["min_price_krw"]) if p is not None]
+    if b["top_score"] is not None and (a["top_score"] is None or b["top_score"] > a["top_score"]):
+        top_score, top_id = b["top_score"], b["top_id"]
+    else:
+        top_score, top_id = a["top_score"], a["top_id"]
+    return {
+        "count": a["count"] + b["count"],
+        "hotel_count": a["hotel_count"] + b["hotel_count"],
+        "spot_count": a["spot_count"] + b["spot_count"],
+        "sum_lat": a["sum_lat"] + b["sum_lat"],
+        "sum_lng": a["sum_lng"] + b["sum_lng"],
+        "min_price_krw": min(prices) if prices else None,
+        "top_score": top_score,
+        "top_id": top_id,
+        "point": None
+    }
+
+
+def _feature(cell):
+    """셀 집계값 → 타일 JSON 항목 (1개면 원래 마커, 여러 개면 클러스터)"""
+    if cell["count"] == 1:
+        return cell["point"]
+    return {
+        "kind": "cluster",
+        "lat": round(cell["sum_lat"] / cell["count"], 6),
+        "lng": round(cell["sum_lng"] / cell["count"], 6),
+        "count": cell["count"],
+        "hotel_count": cell["hotel_count"],
+        "spot_count": cell["spot_count"],
+        "min_price_krw": cell["min_price_krw"],
+        "top_score": cell["top_score"],
+        "top_id": cell["top_id"]
+    }
+
+
+def collect_points(recommendations, local_spots=()):
+    """
+    호텔(top_recommendations)과 스팟(map.local_spots + 호텔별 map_detail.nearby_spots)을 마커 목록으로 수집.
+    같은 id의 호텔, 같은 이름의 스팟은 한 번만 넣는다.
+    """
+    points = []
+    seen_hotels = set()
+    seen_spots = set()
+
+    def add_spot(spot):
+        key = spot.get("name_en")
+        if key in seen_spots or spot.get("lat") is None or spot.get("lng") is None:
+            return
+        seen_spots.add(key)
+        points.append({"kind": "spot", "name_en": key, "category": spot.get("category"),
+                       "lat": float(spot["lat"]), "lng": float(spot["lng"])})
+
+    for hotel in recommendations:
+        if not isinstance(hotel, dict) or hotel.get("lat") is None or hotel.get("lng") is None:
+            continue
+        if hotel.get("id") not in seen_hotels:
+            seen_hotels.add(hotel.get("id"))
+            points.append({"kind": "hotel", "id": hotel.get("id"), "name_en": hotel.get("name_en"),
+                           "lat": float(hotel["lat"]), "lng": float(hotel["lng"]),
+                           "price_krw": hotel.get("price_krw"), "fan_match_score": hotel.get("fan_match_score"),
+                           "is_available": hotel.get("is_available")})
+        map_detail = hotel.get("map_detail")
+        if isinstance(map_detail, dict):
+            for spot in map_detail.get("nearby_spots") or []:
+                if isinstance(spot, dict):
+                    add_spot(spot)
+
+    for spot in local_spots:
+        if isinstance(spot, dict):
+            add_spot(spot)
+    return points
+
+
+def build_clusters(points, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM):
+    """
+    줌별 격자 클러스터를 계층적으로 계산.
+    최대 줌에서 지점을 셀에 넣고, 한 단계씩 올라가며 자식 셀 4개를 부모 셀로 합친다 (줌당 O(셀 수)).
+    반환: {줌: {(셀x, 셀y): 집계값}}
+    """
+    scale = 1 << (max_zoom + CELL_BITS)
+    cells = {}
+    for point in points:
+        x, y = world_xy(point["lat"], point["lng"])
+        key = (min(int(x * scale), scale - 1), min(int(y * scale), scale - 1))
+        cell = _point_cluster(point)
+        cells[key] = _merge(cells[key], cell) if key in cells else cell
+
+    levels = {max_zoom: cells}
+    for zoom in range(max_zoom - 1, min_zoom - 1, -1):
+        parents = {}
+        for (cx, cy), cell in levels[zoom + 1].items():
+            key = (cx >> 1, cy >> 1)
+            parents[key] = _merge(parents[key], cell) if key in parents else cell
+        levels[zoom] = parents
+    return levels
+
+
+def build_tiles(levels):
+    """셀 집계값을 타일 단위로 묶음: {"z/x/y": [항목, ...]}"""
+    tiles = {}
+    for zoom, cells in levels.items():
+        for (cx, cy), cell in cells.items():
+            tile = f"{zoom}/{cx >> CELL_BITS}/{cy >> CELL_BITS}"
+            tiles.setdefault(tile, []).append(_feature(cell))
+    return tiles
+
+
+def write_tiles(tiles, out_dir, min_zoom=MIN_ZOOM, max_zoom=MAX_ZOOM):
+    """타일별 JSON 파일과 index.json 기록 (클라이언트는 뷰포트/줌에 해당하는 타일만 요청)"""
+    if os.path.isdir(out_dir):
+        shutil.rmtree(out_dir)
+    for tile, features in tiles.items():
+        path = os.path.join(out_dir, f"{tile}.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding='utf-8') as f:
+            json.dump(features, f, ensure_ascii=False, separators=(",", ":"))
+
+    with open(os.path.join(out_dir, "index.json"), "w", encoding='utf-8') as f:
+        json.dump({"min_zoom": min_zoom, "max_zoom": max_zoom, "tile_size": 256,
+                   "tiles": sorted(tiles)}, f, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    # 사용법: python3 map_clusters.py [concert_recommendations.json] [출력 폴더]
+    source = sys.argv[1] if len(sys.argv) > 1 else "concert_recommendations.json"
+    out = sys.argv[2] if len(sys.argv) > 2 else "public/map_tiles"
+
+    with open(source, "r", encoding='utf-8') as f:
+        recommendations = json.load(f).get("top_recommendations", [])
+
+    spots = []
+    try:
+        with open("korean_ota_hotels.json", "r", encoding='utf-8') as f:
+            raw = json.load(f)
+        if isinstance(raw, dict) and isinstance(raw.get("map"), dict):
+            spots = raw["map"].get("local_spots") or []
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"⚠️ local_spots unavailable ({e}), clustering hotels and nearby spots only")
+
+    markers = collect_points(recommendations, spots)
+    tile_map = build_tiles(build_clusters(markers))
+    write_tiles(tile_map, out)
+    print(f"🗺️ Clustered {len(markers)} markers into {len(tile_map)} tiles (zoom {MIN_ZOOM}-{MAX_ZOOM}) → {out}")
@@ -0,0 +1,152 @@
+import sys
+import copy
+import json
+
+# 호텔마다 반복되는 하위 객체 경로 → 공유 테이블로 뺄 키 (None = 객체 전체)
+# army_density는 value/label이 호텔별로 다르므로 level 문자열만 공유한다.
+INTERNED_PATHS = {
+    ("hotel_type",): None,
+    ("cancellation",): None,
+    ("booking_guide",): None,
+    ("army_density",): ("level_en", "level_kr"),
+    ("map_detail", "venue"): None
+}
+
+ENCODING = "dict-v1"
+REF = "$ref"
+
+
+def _table_name(path):
+    return ".".join(path)
+
+
+def _canonical(value):
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
+def _parent(record, path):
+    """경로의 마지막 키를 담고 있는 dict (없으면 None)"""
+    node = record
+    for key in path[:-1]:
+        node = node.get(key) if isinstance(node, dict) else None
+    return node if isinstance(node, dict) else None
+
+
+def _split(obj, keys):
+    """공유할 부분과 호텔별로 남길 부분으로 나눔"""
+    if keys is None:
+        return obj, {}
+    shared = {k: obj[k] for k in keys if k in obj}
+    rest = {k: v for k, v in obj.items() if k not in keys}
+    return shared, rest
+
+
+def encode_output(data, paths=INTERNED_PATHS):
+    """
+    concert_recommendations.json 데이터를 사전 인코딩 형태로 변환.
+    반복 하위 객체는 data["dictionary"][테이블명] 목록으로 옮기고 레코드에는 {"$ref": 번호}만 남긴다.
+    원본 data는 변경하지 않는다.
+    """
+    tables = {_table_name(p): [] for p in paths}
+    lookup = {_table_name(p): {} for p in paths}
+
+    def encode_record(record):
+        record = dict(record)
+        for path, keys in paths.items():
+            # 경로상의 중간 dict는 복사해서 원본을 건드리지 않음
+            node = record
+            for key in path[:-1]:
+                if not isinstance(node.get(key), dict):
+                    node = None
+                    break
+                node[key] = dict(node[key])
+                node = node[key]
+            if node is None or not isinstance(node.get(path[-1]), dict):
+                continue
+
+            shared, rest = _split(node[path[-1]], keys)
+            if not shared:
+                continue
+            name = _table_name(path)
+            key = _canonical(shared)
+            if key not in lookup[name]:
+                lookup[name][key] = len(tables[name])
+                tables[name].append(shared)
+            node[path[-1]] = {REF: lookup[name][key], **rest}
+        return record
+
+    encoded = {k: v for k, v in data.items() if k != "top_recommendations"}
+    encoded["encoding"] = ENCODING
+    encoded["top_recommendations"] = [
+        encode_record(h) if isinstance(h, dict) else h for h in data.get("top_recommendations", [])
+    ]
+    encoded["dictionary"] = tables
+    return encoded
+
+
+def decode_output(data, paths=INTERNED_PATHS):
+    """사전 인코딩된 데이터를 원래의 펼친 형태로 복원 (인코딩 안 된 데이터는 그대로 반환)"""
+    if data.get("encoding") != ENCODING:
+        return data
+
+    tables = data.get("dictionary", {})
+    decoded = {k: v for k, v in data.items() if k not in ("encoding", "dictionary", "top_recommendations")}
+    records = []
+    for record in data.get("top_recommendations", []):
+        if isinstance(record, dict):
+            record = copy.deepcopy(record)
+            for path in paths:
+                parent = _parent(record, path)
+                ref = parent.get(path[-1]) if parent else None
+                if isinstance(ref, dict) and REF in ref:
+                    rest = {k: v for k, v in ref.items() if k != REF}
+                    parent[path[-1]] = {**tables[_table_name(path)][ref[REF]], **rest}
+        records.append(record)
+    decoded["top_recommendations"] = records
+    return decoded
+
+
+def intern_hotels(hotels, paths=INTERNED_PATHS):
+    """
+    로드 시점 메모리 인터닝: 내용이 같은 하위 객체를 하나의 dict 인스턴스로 공유시킨다.
+    부분 공유 경로(army_density 등)는 레코드별 값이 섞여 있으므로 문자열만 인터닝한다.
+    반환값: 공유로 대체된 객체 수
+    """
+    pools = {path: {} for path in paths}
+    replaced = 0
+    for hotel in hotels:
+        if not isinstance(hotel, dict):
+            continue
+        for path, keys in paths.items():
+            parent = _parent(hotel, path)
+            obj = parent.get(path[-1]) if parent else None
+            if not isinstance(obj, dict):
+                continue
+            if keys is None:
+                canonical = pools[path].setdefault(_canonical(obj), obj)
+                if canonical is not obj:
+                    parent[path[-1]] = canonical
+                    replaced += 1
+            else:
+                for k in keys:
+                    if isinstance(obj.get(k), str):
+                        obj[k] = sys.intern(obj[k])
+    return replaced
+
+
+if __name__ == "__main__":
+    # 사용법: python3 output_dictionary.py encode|decode <입력.json> <출력.json>
+    if len(sys.argv) != 4 or sys.argv[1] not in ("encode", "decode"):
+        print("Usage: python3 output_dictionary.py encode|decode <input.json> <output.json>")
+        sys.exit(1)
+
+    with open(sys.argv[2], "r", encoding='utf-8') as f:
+        source = json.load(f)
+
+    result = encode_output(source) if sys.argv[1] == "encode" else decode_output(source)
+    with open(sys.argv[3], "w", encoding='utf-8') as f:
+        if sys.argv[1] == "encode":
+            json.dump(result, f, ensure_ascii=False, separators=(",", ":"))
+        else:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    print(f"✅ {sys.argv[1].capitalize()}d {len(result.get('top_recommendations', []))} hotels → {sys.argv[3]}")
@@ -0,0 +1,216 @@
+import sys
+import json
+import math
+from datetime import date, timedelta
+
+try:
+    import numpy as np
+except ImportError:
+    print("❌ Error: numpy is required for the price calendar")
+    print("   Please run: pip install numpy")
+    raise
+
+# 객실 수 정보가 없는 박 (예약 가능으로 취급) - min 집계에서 자연히 무시되도록 int16 최대값 사용
+UNKNOWN_ROOMS = np.iinfo(np.int16).max
+
+
+def _as_date(value):
+    return value if isinstance(value, date) else date.fromisoformat(str(value)[:10])
+
+
+class PriceCalendar:
+    """
+    호텔 × 박(night) 단위 가격/잔여 객실 저장소.
+    가격은 float32 (NaN = 가격 정보 없음), 객실은 int16 (UNKNOWN_ROOMS = 정보 없음) 2차원 배열로 보관하고
+    숙박 구간 질의(총액, 최소 잔여 객실)는 열 슬라이스 연산 한 번으로 전 호텔을 계산한다.
+    """
+
+    def __init__(self, hotel_ids, start, end):
+        self.start = _as_date(start)
+        self.end = _as_date(end)
+        self.nights = (self.end - self.start).days
+        if self.nights <= 0:
+            raise ValueError(f"Calendar end {self.end} must be after start {self.start}")
+
+        self.ids = list(dict.fromkeys(hotel_ids))
+        self._row = {hid: i for i, hid in enumerate(self.ids)}
+        self.price = np.full((len(self.ids), self.nights), np.nan, dtype=np.float32)
+        self.rooms = np.full((len(self.ids), self.nights), UNKNOWN_ROOMS, dtype=np.int16)
+
+        # 박 단위 입력 오류 (호텔 id, 날짜, 사유) - 예외 대신 모아서 보고
+        self.errors = []
+
+    @classmethod
+    def from_hotels(cls, hotels, start, end):
+        """
+        호텔 목록으로 달력 초기화.
+        달력 범위는 start~end와 모든 레코드의 'calendar' 날짜를 포함하는 투어 전체 기간으로 한 번 잡고,
+        숙박 구간 질의는 그 안에서 열을 잘라 계산한다.
+        기본값은 레코드의 단일 price_krw/rooms_left를 전 기간에 채우고,
+        레코드에 'calendar' ({"YYYY-MM-DD": {"price_krw", "rooms_left"}}) 가 있으면 해당 박을 덮어쓴다.
+        """
+        hotels = [h for h in hotels if isinstance(h, dict) and h.get('id')]
+
+        first, last = _as_date(start), _as_date(end)
+        for hotel in hotels:
+            if not isinstance(hotel.get('calendar'), dict):
+                continue
+            for night in hotel['calendar']:
+                try:
+                    night = _as_date(night)
+                except ValueError:
+                    continue  # 아래 set_night 단계에서 오류로 기록됨
+                first, last = min(first, night), max(last, night + timedelta(days=1))
+
+        cal = cls([h['id'] for h in hotels], first, last)
+        for hotel in hotels:
+            row = cal._row[hotel['id']]
+            if hotel.get('price_krw') is not None:
+                cal.price[row, :] = hotel['price_krw']
+            # 같은 id의 축약 레코드(map/hotels)가 객실 정보를 지우지 않도록 있는 값만 반영
+            if hotel.get('is_available') is False:
+                cal.rooms[row, :] = 0
+            elif hotel.get('rooms_left') is not None:
+                cal.rooms[row, :] = hotel['rooms_left']
+
+            calendar = hotel.get('calendar')
+            if calendar is None:
+                continue
+            if not isinstance(calendar, dict):
+                cal.errors.append((hotel['id'], None, "calendar: wrong_type"))
+                continue
+            for night, values in calendar.items():
+                try:
+                    if not isinstance(values, dict):
+                        raise ValueError("night entry: wrong_type")
+                    cal.set_night(hotel['id'], night, values.get('price_krw'), values.get('rooms_left'))
+                except ValueError as e:
+                    cal.errors.append((hotel['id'], night, str(e)))
+
+        if cal.errors:
+            print(f"⚠️ Calendar: skipped {len(cal.errors)} invalid nights")
+            for hid, night, reason in cal.errors[:10]:
+                print(f"   ⚠️ {hid} {night}: {reason}")
+        return cal
+
+    def _col(self, night):
+        col = (_as_date(night) - self.start).days
+        if not 0 <= col < self.nights:
+            raise ValueError(f"Night {night} outside calendar {self.start}..{self.end}")
+        return col
+
+    def _window(self, check_in, check_out):
+        first = self._col(check_in)
+        last = self._col(_as_date(check_out) - timedelta(days=1))
+        if last < first:
+            raise ValueError(f"Check-out {check_out} must be after check-in {check_in}")
+        return slice(first, last + 1)
+
+    def set_night(self, hotel_id, night, price_krw=None, rooms_left=None):
+        """한 호텔의 특정 박 가격/객실 갱신 (None인 값은 유지, 잘못된 값은 아무것도 바꾸지 않고 ValueError)"""
+        row = self._row[hotel_id]
+        try:
+            col = self._col(night)
+        except ValueError as e:
+            raise ValueError(f"date: {e}")
+        try:
+            price = None if price_krw is None else float(price_krw)
+            if price is not None and (not math.isfinite(price) or price < 0):
+                raise ValueError
+        except (TypeError, ValueError):
+            raise ValueError(f"price_krw: bad_float ({price_krw!r})")
+        try:
+            rooms = None if rooms_left is None else int(rooms_left)
+            if rooms is not None and not 0 <= rooms < UNKNOWN_ROOMS:
+                raise ValueError
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"rooms_left: bad_int ({rooms_left!r})")
+
+        if price is not None:
+            self.price[row, col] = price
+        if rooms is not None:
+            self.rooms[row, col] = rooms
+
+    def load_jsonl(self, path):
+        """박 단위 업데이트 JSONL 적용: {"id", "date", "price_krw", "rooms_left"}"""
+        applied = 0
+        with open(path, "r", encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                    self.set_night(item['id'], item['date'], item.get('price_krw'), item.get('rooms_left'))
+                    applied += 1
+                except (json.JSONDecodeError, KeyError, ValueError) as e:
+                    print(f"⚠️ Skipping calendar line {line_no}: {e}")
+        return applied
+
+    def stay_totals(self, check_in, check_out):
+        """
+        전 호텔의 숙박 구간 총액과 최소 잔여 객실 (호텔 순서 = self.ids).
+        가격이 비어 있는 박이 하나라도 있으면 총액은 NaN,
+        구간 내내 객실 정보가 없으면 최소 잔여 객실은 UNKNOWN_ROOMS.
+        """
+        window = self._window(check_in, check_out)
+        total = self.price[:, window].sum(axis=1, dtype=np.float64)
+        min_rooms = self.rooms[:, window].min(axis=1)
+        return total, min_rooms
+
+    def available_mask(self, check_in, check_out, rooms=1):
+        total, min_rooms = self.stay_totals(check_in, check_out)
+        return (min_rooms >= rooms) & ~np.isnan(total)
+
+    def cheapest(self, check_in, check_out, limit=10, rooms=1):
+        """구간 내내 예약 가능한 호텔 중 총액 낮은 순 (id, 총액, 최소 잔여 객실)"""
+        total, min_rooms = self.stay_totals(check_in, check_out)
+        candidates = np.flatnonzero((min_rooms >= rooms) & ~np.isnan(total))
+        order = candidates[np.argsort(total[candidates], kind="stable")][:limit]
+        return [(self.ids[i], int(total[i]), None if min_rooms[i] == UNKNOWN_ROOMS else int(min_rooms[i]))
+                for i in order]
+
+    def annotate(self, hotels, check_in, check_out):
+        """
+        호텔 레코드에 숙박 구간 정보('stay') 기록하고 rooms_left/is_available을 구간 기준으로 맞춘다.
+        추천 엔진이 정렬 전에 호출해 순위에 반영한다.
+        """
+        total, min_rooms = self.stay_totals(check_in, check_out)
+        nights = (_as_date(check_out) - _as_date(check_in)).days
+        for hotel in hotels:
+            row = self._row.get(hotel.get('id')) if isinstance(hotel, dict) else None
+            if row is None:
+                continue
+            known = not np.isnan(total[row])
+            rooms = None if min_rooms[row] == UNKNOWN_ROOMS else int(min_rooms[row])
+            hotel['stay'] = {
+                "check_in": str(_as_date(check_in)),
+                "check_out": str(_as_date(check_out)),
+                "nights": nights,
+                "total_price_krw": int(total[row]) if known else None,
+                "min_rooms_left": rooms
+            }
+            # 객실 수를 모르면 기존 rooms_left는 그대로 두고 예약 가능으로 취급
+            if rooms is not None:
+                hotel['rooms_left'] = rooms
+            hotel['is_available'] = bool(known and (rooms is None or rooms > 0))
+        return hotels
+
+
+if __name__ == "__main__":
+    # 사용법: python3 price_calendar.py <check_in> <check_out> [nightly_updates.jsonl]
+    if len(sys.argv) < 3:
+        print("Usage: python3 price_calendar.py <check_in> <check_out> [nightly_updates.jsonl]")
+        sys.exit(1)
+
+    with open("concert_recommendations.json", "r", encoding='utf-8') as f:
+        records = json.load(f).get('top_recommendations', [])
+
+    stay_in, stay_out = _as_date(sys.argv[1]), _as_date(sys.argv[2])
+    calendar = PriceCalendar.from_hotels(records, stay_in, stay_out)
+    if len(sys.argv) > 3:
+        print(f"✓ Applied {calendar.load_jsonl(sys.argv[3])} nightly updates")
+
+    print(f"🏨 Cheapest available stays {stay_in} → {stay_out}:")
+    names = {h['id']: h.get('name_en') for h in records if isinstance(h, dict) and h.get('id')}
+    for hid, stay_total, left in calendar.cheapest(stay_in, stay_out):
+        print(f"  ✓ {names.get(hid, hid)}: {stay_total:,} KRW ({'?' if left is None else left} rooms left)")
@@ -0,0 +1,125 @@
+import os
+import sys
+import json
+import hashlib
+
+# 매 실행마다 바뀌지만 내용 변화로 보지 않는 필드
+IGNORED_INFO_FIELDS = {"generated_at"}
+# 배포 결과물에 영향을 주는 프론트엔드 소스 (추천 데이터 외 변경 감지용)
+FRONTEND_PATHS = ("src", "public", "index.html", "package.json", "package-lock.json",
+                  "vite.config.ts", "postcss.config.mjs", "tsconfig.json", "tsconfig.node.json")
+# 빌드 스크립트가 복사해 넣는 추천 데이터 - 데이터 비교로 따로 판단하므로 지문에서 제외
+# (public/map_tiles는 포함: local_spots 변경처럼 추천 데이터에 안 드러나는 타일 변화도 감지)
+GENERATED_PATHS = ("public/concert_recommendations.json",)
+
+
+def record_hash(record):
+    """레코드 내용 해시 (키 순서와 무관하도록 정렬 직렬화)"""
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def index_records(records):
+    """
+    (id, 등장 순번) → (순위, 해시) 매핑.
+    같은 id가 여러 번 나오는 출력(hotels + map/hotels 병합)도 순번으로 구분한다.
+    """
+    index = {}
+    seen = {}
+    for rank, record in enumerate(records, 1):
+        if not isinstance(record, dict):
+            continue
+        rid = record.get("id") or record.get("name_en")
+        occurrence = seen.get(rid, 0)
+        seen[rid] = occurrence + 1
+        index[(rid, occurrence)] = (rank, record_hash(record))
+    return index
+
+
+def diff_recommendations(old, new):
+    """두 concert_recommendations.json 버전의 구조적 차이 (O(n))"""
+    old_index = index_records(old.get("top_recommendations", []))
+    new_index = index_records(new.get("top_recommendations", []))
+
+    added, removed, changed, moved = [], [], [], []
+    for key, (rank, digest) in new_index.items():
+        if key not in old_index:
+            added.append({"id": key[0], "rank": rank})
+            continue
+        old_rank, old_digest = old_index[key]
+        if old_digest != digest:
+            changed.append({"id": key[0], "rank": rank})
+        if old_rank != rank:
+            moved.append({"id": key[0], "old_rank": old_rank, "new_rank": rank})
+    for key, (rank, _) in old_index.items():
+        if key not in new_index:
+            removed.append({"id": key[0], "rank": rank})
+
+    old_info = {k: v for k, v in old.get("concert_info", {}).items() if k not in IGNORED_INFO_FIELDS}
+    new_info = {k: v for k, v in new.get("concert_info", {}).items() if k not in IGNORED_INFO_FIELDS}
+
+    return {
+        "concert_info_changed": old_info != new_info,
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "moved": moved
+    }
+
+
+def has_changes(report):
+    return report["concert_info_changed"] or any(report[k] for k in ("added", "removed", "changed", "moved"))
+
+
+def frontend_fingerprint(paths=FRONTEND_PATHS, root="."):
+    """프론트엔드 소스 전체의 내용 해시 (파일 경로 + 내용, 경로순) - 커밋 안 된 수정도 반영"""
+    excluded = tuple(os.path.normpath(p) for p in GENERATED_PATHS)
+    files = []
+    for path in paths:
+        full = os.path.join(root, path)
+        if os.path.isfile(full):
+            files.append(os.path.normpath(path))
+        for base, dirs, names in os.walk(full):
+            dirs[:] = [d for d in dirs if d not in ("node_modules", ".git")]
+            files += [os.path.normpath(os.path.relpath(os.path.join(base, n), root)) for n in names]
+
+    digest = hashlib.sha1()
+    for rel in sorted(set(files)):
+        if any(rel == e or rel.startswith(e + os.sep) for e in excluded):
+            continue
+        digest.update(rel.replace(os.sep, "/").encode("utf-8") + b"\0")
+        with open(os.path.join(root, rel), "rb") as f:
+            digest.update(hashlib.sha1(f.read()).digest())
+    return digest.hexdigest()
+
+
+if __name__ == "__main__":
+    # 사용법: python3 recommendations_diff.py <old.json> <new.json>
+    #         python3 recommendations_diff.py --fingerprint  (프론트엔드 소스 지문 출력)
+    # 종료 코드: 0 = 변경 없음, 1 = 변경 있음, 2 = 비교 불가 (diff 관례)
+    if sys.argv[1:] == ["--fingerprint"]:
+        print(frontend_fingerprint())
+        sys.exit(0)
+
+    if len(sys.argv) != 3:
+        print("Usage: python3 recommendations_diff.py <old.json> <new.json>")
+        sys.exit(2)
+
+    try:
+        with open(sys.argv[1], "r", encoding='utf-8') as f:
+            old_data = json.load(f)
+        with open(sys.argv[2], "r", encoding='utf-8') as f:
+            new_data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"⚠️ Cannot compare recommendations: {e}")
+        sys.exit(2)
+
+    report = diff_recommendations(old_data, new_data)
+    print(f"📊 Added: {len(report['added'])}, Removed: {len(report['removed'])}, "
+          f"Changed: {len(report['changed'])}, Rank moves: {len(report['moved'])}, "
+          f"Concert info changed: {report['concert_info_changed']}")
+    for kind in ("added", "removed", "changed", "moved"):
+        for item in report[kind][:10]:
+            print(f"   {kind}: {item}")
+
+    sys.exit(1 if has_changes(report) else 0)
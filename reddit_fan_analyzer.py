@@ -1,8 +1,113 @@
 import os
+import re
+import sys
 import json
+from collections import Counter
+from multiprocessing import Pool
+
+# 니즈별 키워드 사전 (게시글/댓글 텍스트에서 소문자 매칭)
+NEED_KEYWORDS = {
+    "budget_sensitivity": ["price", "expensive", "overpriced", "gouging", "price hike", "cheap", "budget", "afford", "scalp"],
+    "location_transit": ["subway", "station", "transit", "walking distance", "near the venue", "close to", "kintex", "location"],
+    "cancellation_flexibility": ["cancel", "cancelled", "canceled", "cancellation", "refund", "non-refundable", "rebook"],
+    "safety_late_night": ["safe", "safety", "late night", "alone", "solo", "crowd", "after the concert", "dark"],
+    "concert_logistics": ["shuttle", "taxi", "bus", "luggage", "locker", "merch", "line up", "queue"]
+}
+
+# 인사이트 카테고리 → 근거가 되는 니즈
+INSIGHT_CATEGORIES = {
+    "Price": "budget_sensitivity",
+    "Safety": "safety_late_night",
+    "Transport": "concert_logistics",
+    "Policy": "cancellation_flexibility",
+    "Location": "location_transit"
+}
+
+# 청크 크기 (바이트) - 워커 하나가 한 번에 처리하는 분량
+CHUNK_BYTES = 8 * 1024 * 1024
+# 마지막 개행을 찾을 때 뒤에서부터 한 번에 읽는 분량
+TAIL_BLOCK = 64 * 1024
+
+_PATTERNS = {
+    need: re.compile(r"\b(?:" + "|".join(re.escape(k) for k in sorted(words, key=len, reverse=True)) + r")\b")
+    for need, words in NEED_KEYWORDS.items()
+}
+
+
+def _record_text(line):
+    """JSONL 한 줄에서 분석 대상 텍스트 추출 (게시글: title+selftext, 댓글: body)"""
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(record, dict):
+        return None
+    parts = [record.get(k) for k in ("title", "selftext", "body")]
+    return " ".join(p for p in parts if isinstance(p, str)).lower()
+
+
+def _last_record_end(f, start, size):
+    """
+    [start, size) 구간에서 마지막으로 완성된 레코드의 끝 위치.
+    개행이 나올 때까지 블록 단위로 거슬러 읽고, 개행 뒤에 남은 줄이 JSON으로 파싱되면
+    (개행 없이 끝난 덤프) 파일 끝까지 완성된 것으로 본다. 파싱 안 되면 아직 쓰는 중인 줄.
+    """
+    end = size
+    while end > start:
+        block_start = max(start, end - TAIL_BLOCK)
+        f.seek(block_start)
+        newline = f.read(end - block_start).rfind(b"\n")
+        if newline >= 0:
+            end = block_start + newline + 1
+            break
+        end = block_start
+
+    if end < size:
+        f.seek(end)
+        try:
+            json.loads(f.read(size - end))
+            return size
+        except ValueError:
+            pass
+    return end
+
+
+def _scan_chunk(args):
+    """
+    [start, end) 바이트 구간의 줄을 처리하는 워커.
+    시작 위치가 줄 중간이면 그 줄은 이전 청크 몫이므로 건너뛴다.
+    aligned면 start가 레코드 경계(파일 처음 또는 체크포인트)이므로 건너뛰지 않는다.
+    """
+    path, start, end, aligned = args
+    docs = 0
+    doc_hits = Counter()
+    term_hits = {need: Counter() for need in NEED_KEYWORDS}
+
+    with open(path, "rb") as f:
+        if start > 0 and not aligned:
+            f.seek(start - 1)
+            f.readline()
+        else:
+            f.seek(start)
+        while f.tell() < end:
+            line = f.readline()
+            if not line:
+                break
+            text = _record_text(line)
+            if not text:
+                continue
+            docs += 1
+            for need, pattern in _PATTERNS.items():
+                found = pattern.findall(text)
+                if found:
+                    doc_hits[need] += 1
+                    term_hits[need].update(found)
+
+    return docs, doc_hits, term_hits
+
 
 class RedditFanAnalyzer:
-    def __init__(self):
+    def __init__(self, checkpoint_path="reddit_fan_checkpoint.json", workers=None):
         # 클로드가 설계한 해외 ARMY 5대 핵심 니즈 가중치
         self.priorities = {
             "budget_sensitivity": 0.95,       # 바가지 요금(Price Gouging) 우려
@@ -11,8 +116,118 @@ class RedditFanAnalyzer:
             "safety_late_night": 0.75,        # 심야 귀가 안전
             "concert_logistics": 0.70         # 셔틀 및 현지 물류
         }
+        self.checkpoint_path = checkpoint_path
+        self.workers = workers or os.cpu_count() or 1
+
+    def _load_checkpoint(self, dump_path):
+        """같은 덤프에 대한 체크포인트가 있으면 이어서 처리 (덤프는 append-only 가정)"""
+        empty = {"dump": os.path.abspath(dump_path), "offset": 0, "docs": 0,
+                 "doc_hits": {}, "term_hits": {need: {} for need in NEED_KEYWORDS}}
+        try:
+            with open(self.checkpoint_path, "r", encoding='utf-8') as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return empty
+
+        if state.get("dump") != empty["dump"] or state.get("offset", 0) > os.path.getsize(dump_path):
+            print("⚠️ Checkpoint does not match dump (replaced or truncated), reprocessing from start")
+            return empty
+        return state
+
+    def _save_checkpoint(self, state):
+        with open(self.checkpoint_path, "w", encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+
+    def analyze_dump(self, dump_path):
+        """덤프를 체크포인트 이후부터 청크 단위 병렬 처리 후 누적 집계 반환"""
+        state = self._load_checkpoint(dump_path)
+        size = os.path.getsize(dump_path)
+        start = state["offset"]
+
+        # 마지막 줄이 아직 쓰는 중일 수 있으므로 완성된 레코드까지만 처리
+        with open(dump_path, "rb") as f:
+            end = _last_record_end(f, start, size)
+
+        if end <= start:
+            print("✓ No new records since last checkpoint")
+            return state
+
+        chunks = [(dump_path, s, min(s + CHUNK_BYTES, end), s == start) for s in range(start, end, CHUNK_BYTES)]
+        print(f"🔄 Scanning {end - start:,} bytes in {len(chunks)} chunks with {self.workers} workers...")
+
+        doc_hits = Counter(state["doc_hits"])
+        term_hits = {need: Counter(state["term_hits"].get(need, {})) for need in NEED_KEYWORDS}
+        docs = state["docs"]
+
+        if self.workers > 1 and len(chunks) > 1:
+            with Pool(self.workers) as pool:
+                results = pool.imap_unordered(_scan_chunk, chunks)
+                for chunk_docs, chunk_doc_hits, chunk_term_hits in results:
+                    docs += chunk_docs
+                    doc_hits.update(chunk_doc_hits)
+                    for need, counter in chunk_term_hits.items():
+                        term_hits[need].update(counter)
+        else:
+            for chunk in chunks:
+                chunk_docs, chunk_doc_hits, chunk_term_hits = _scan_chunk(chunk)
+                docs += chunk_docs
+                doc_hits.update(chunk_doc_hits)
+                for need, counter in chunk_term_hits.items():
+                    term_hits[need].update(counter)
+
+        state = {
+            "dump": state["dump"],
+            "offset": end,
+            "docs": docs,
+            "doc_hits": dict(doc_hits),
+            "term_hits": {need: dict(counter) for need, counter in term_hits.items()}
+        }
+        self._save_checkpoint(state)
+        print(f"✓ Processed {docs:,} posts/comments in total (checkpoint at byte {end:,})")
+        return state
+
+    def derive_priorities(self, state):
+        """언급 비율을 0.5~1.0 가중치로 정규화 (가장 많이 언급된 니즈 = 1.0)"""
+        top = max(state["doc_hits"].values(), default=0)
+        if not top:
+            return dict(self.priorities)
+        return {
+            need: round(0.5 + 0.5 * state["doc_hits"].get(need, 0) / top, 2)
+            for need in self.priorities
+        }
+
+    def derive_insights(self, state):
+        """카테고리별 언급 비율과 대표 키워드로 인사이트 문장 생성 (언급 많은 순)"""
+        docs = state["docs"]
+        insights = []
+        for category, need in INSIGHT_CATEGORIES.items():
+            hits = state["doc_hits"].get(need, 0)
+            if not hits:
+                continue
+            top_terms = [t for t, _ in Counter(state["term_hits"].get(need, {})).most_common(3)]
+            insights.append({
+                "category": category,
+                "insight": f"{hits / docs:.1%} of {docs:,} fan posts mention {category.lower()} concerns "
+                           f"(top terms: {', '.join(top_terms)}).",
+                "mentions": hits
+            })
+        insights.sort(key=lambda x: x["mentions"], reverse=True)
+        return insights
+
+    def run(self, dump_path=None, use_fallback=True):
+        if dump_path and os.path.exists(dump_path):
+            state = self.analyze_dump(dump_path)
+            if state["docs"]:
+                self.priorities = self.derive_priorities(state)
+                insights = self.derive_insights(state)
+                return self._result(insights)
+            print("⚠️ Dump contained no readable posts")
+        elif dump_path:
+            print(f"⚠️ Dump not found: {dump_path}")
+
+        if not use_fallback:
+            return self._result([])
 
-    def run(self, use_fallback=True):
         # 레딧 감성 분석 인사이트 (해외 팬들의 실제 목소리 반영)
         insights = [
             {"category": "Price", "insight": "International fans report 5-10x price hikes in Goyang near KINTEX."},
@@ -20,6 +235,9 @@ class RedditFanAnalyzer:
             {"category": "Transport", "insight": "High demand for dedicated shuttle services to avoid taxi scarcity."},
             {"category": "Policy", "insight": "Fears of 'Foreigner-only' booking cancellations reported in fan communities."}
         ]
+        return self._result(insights)
+
+    def _result(self, insights):
         return {
             "insights": insights,
             "need_priorities": self.priorities,
@@ -31,8 +249,9 @@ class RedditFanAnalyzer:
         }
 
 if __name__ == "__main__":
+    # 사용법: python3 reddit_fan_analyzer.py [reddit_dump.jsonl]
     analyzer = RedditFanAnalyzer()
-    result = analyzer.run()
+    result = analyzer.run(sys.argv[1] if len(sys.argv) > 1 else None)
     with open("reddit_fan_analysis.json", "w", encoding='utf-8') as f:
         json.dump(result, f, indent=2, ensure_ascii=False)
     print("✅ Reddit fan analysis (Raw Logic) completed.")